@@ -0,0 +1,489 @@
+"""
+analyzer.py - Data analysis functions for CSV files
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List
+
+from features import DataFrameFeatures
+
+
+class CSVAnalyzer:
+    """Analyze and extract insights from CSV data"""
+
+    def __init__(self, df, features=None):
+        """
+        Initialize the analyzer
+
+        Args:
+            df: pandas DataFrame to analyze
+            features: Optional shared DataFrameFeatures, so facts such as
+                      null counts are computed once across the analyzer
+                      and validator
+        """
+        self.df = df
+        self.features = features if features is not None else DataFrameFeatures(df)
+        self._correlations = None
+        self._memory_bytes = None
+
+    def _get_null_counts(self):
+        """
+        Get per-column null counts, computed once and cached
+
+        Returns:
+            Series of null counts indexed by column
+        """
+        return self.features.null_counts
+
+    def _get_memory_bytes(self):
+        """
+        Get the frame's deep memory usage, computed once and cached
+
+        memory_usage(deep=True) walks every Python string in object
+        columns, so repeated calls are expensive on string-heavy data.
+
+        Returns:
+            Total memory usage in bytes as int
+        """
+        if self._memory_bytes is None:
+            self._memory_bytes = int(self.df.memory_usage(deep=True).sum())
+        return self._memory_bytes
+
+    @staticmethod
+    def _json_round(value, decimals=4):
+        """
+        Round a numeric value to a JSON-safe Python float
+
+        Non-finite values become None at the source, so report payloads
+        never need a recursive sanitation walk before serialization.
+
+        Args:
+            value: Numeric value (Python or NumPy scalar)
+            decimals: Decimal places to round to
+
+        Returns:
+            Rounded float, or None if the value is NaN/Inf
+        """
+        if not np.isfinite(value):
+            return None
+        return round(float(value), decimals)
+
+    @staticmethod
+    def _basic_stats(arr):
+        """
+        Compute mean, min, max, variance, skewness and kurtosis for a
+        NaN-free float64 array
+
+        Derives all higher moments from a single centered buffer instead
+        of one pandas reduction call per statistic, matching pandas'
+        sample (ddof=1) variance and adjusted skew/kurtosis definitions.
+
+        Args:
+            arr: 1D float64 ndarray without NaNs
+
+        Returns:
+            Tuple of (mean, min, max, variance, skewness, kurtosis)
+        """
+        n = arr.size
+        mean = arr.mean()
+
+        centered = arr - mean
+        squared = centered * centered
+        m2 = squared.mean()
+        m3 = (squared * centered).mean()
+        m4 = (squared * squared).mean()
+
+        variance = m2 * n / (n - 1) if n > 1 else np.nan
+
+        if n < 3 or m2 == 0:
+            skewness = 0.0 if (n >= 3 and m2 == 0) else np.nan
+        else:
+            skewness = (m3 / m2 ** 1.5) * np.sqrt(n * (n - 1)) / (n - 2)
+
+        if n < 4 or m2 == 0:
+            kurtosis = 0.0 if (n >= 4 and m2 == 0) else np.nan
+        else:
+            g2 = m4 / (m2 * m2) - 3
+            kurtosis = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+
+        return mean, arr.min(), arr.max(), variance, skewness, kurtosis
+
+    def _summarize_numeric_column(self, col):
+        """
+        Compute the summary statistics dict for a single numeric column
+
+        Args:
+            col: Column name
+
+        Returns:
+            Statistics dictionary, or None if the column is all-NaN
+        """
+        col_data = self.df[col].dropna()
+
+        if len(col_data) == 0:
+            return None
+
+        arr = col_data.to_numpy(dtype=np.float64)
+        # One introselect pass for all three quantiles instead of
+        # separate q25/median/q75/iqr calls
+        q25, median, q75 = np.quantile(arr, [0.25, 0.5, 0.75])
+        mean, min_val, max_val, variance, skewness, kurtosis = self._basic_stats(arr)
+
+        return {
+            'count': int(arr.size),
+            'mean': self._json_round(mean),
+            'median': self._json_round(median),
+            'std_dev': self._json_round(np.sqrt(variance)),
+            'min': self._json_round(min_val),
+            'max': self._json_round(max_val),
+            'q25': self._json_round(q25),
+            'q75': self._json_round(q75),
+            'iqr': self._json_round(q75 - q25),
+            'variance': self._json_round(variance),
+            'skewness': self._json_round(skewness),
+            'kurtosis': self._json_round(kurtosis)
+        }
+
+    @staticmethod
+    def _map_columns(func, columns):
+        """
+        Apply a per-column function, threading across columns when there
+        are several
+
+        The per-column kernels run in NumPy/C code that releases the GIL,
+        so independent columns scale across cores.
+
+        Args:
+            func: Callable taking a column name
+            columns: Iterable of column names
+
+        Returns:
+            List of func results in column order
+        """
+        columns = list(columns)
+
+        if len(columns) < 2:
+            return [func(col) for col in columns]
+
+        max_workers = min(len(columns), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, columns))
+
+    def get_summary_stats(self):
+        """
+        Get descriptive statistics for numeric columns
+
+        Returns:
+            Dictionary with summary statistics
+        """
+        numeric_cols = list(self.df.select_dtypes(include=[np.number]).columns)
+        results = self._map_columns(self._summarize_numeric_column, numeric_cols)
+
+        return {col: col_stats for col, col_stats in zip(numeric_cols, results)
+                if col_stats is not None}
+    
+    def get_null_distribution(self):
+        """
+        Get null value distribution across columns
+        
+        Returns:
+            Dictionary with null statistics
+        """
+        null_dist = {}
+
+        for col, null_count in self._get_null_counts().items():
+            null_dist[col] = {
+                'null_count': int(null_count),
+                'null_percentage': round(100 * null_count / len(self.df), 2),
+                'non_null_count': int(len(self.df) - null_count),
+                'non_null_percentage': round(100 * (len(self.df) - null_count) / len(self.df), 2)
+            }
+        
+        return null_dist
+    
+    def _compute_correlations(self):
+        """
+        Compute the correlation matrix for numeric columns with NumPy
+
+        Uses np.corrcoef (BLAS-backed) when the numeric frame is NaN-free
+        and falls back to DataFrame.corr otherwise: masked-array corrcoef
+        is not pairwise-complete-aware and can report coefficients
+        outside [-1, 1] on complementary missing rows. The result is
+        cached so get_correlation_matrix and get_high_correlations share
+        one computation per report.
+
+        Returns:
+            Tuple of (column names, correlation matrix as 2D ndarray),
+            or (columns, None) if there are no numeric columns
+        """
+        if self._correlations is not None:
+            return self._correlations
+
+        numeric_df = self.df.select_dtypes(include=[np.number])
+        columns = list(numeric_df.columns)
+
+        if len(columns) == 0:
+            corr = None
+        elif len(columns) == 1:
+            corr = np.ones((1, 1))
+        else:
+            arr = numeric_df.to_numpy(dtype=np.float64, copy=False)
+            if np.isnan(arr).any():
+                corr = numeric_df.corr().to_numpy()
+            else:
+                corr = np.corrcoef(arr, rowvar=False)
+
+        self._correlations = (columns, corr)
+        return self._correlations
+
+    def get_correlation_matrix(self):
+        """
+        Get correlation matrix for numeric columns
+
+        Returns:
+            Correlation matrix as dictionary
+        """
+        columns, corr = self._compute_correlations()
+
+        if corr is None:
+            return {}
+
+        corr = np.round(corr, 3)
+        # One vectorized finiteness pass; NaN entries (constant columns)
+        # become None so the payload is JSON-safe without sanitation
+        finite = np.isfinite(corr)
+
+        # Convert to dictionary format (column -> {column: correlation})
+        corr_dict = {
+            col: {row: float(corr[i, j]) if finite[i, j] else None
+                  for i, row in enumerate(columns)}
+            for j, col in enumerate(columns)
+        }
+
+        return corr_dict
+
+    def get_high_correlations(self, threshold=0.7):
+        """
+        Get pairs of highly correlated columns
+
+        Args:
+            threshold: Correlation threshold (0-1)
+
+        Returns:
+            List of highly correlated column pairs
+        """
+        columns, corr = self._compute_correlations()
+
+        if corr is None or len(columns) < 2:
+            return []
+
+        # Upper triangle pair indices in one vectorized pass
+        abs_corr = np.abs(corr)
+        row_idx, col_idx = np.triu_indices_from(abs_corr, k=1)
+
+        pair_values = abs_corr[row_idx, col_idx]
+        mask = pair_values > threshold
+
+        row_idx, col_idx = row_idx[mask], col_idx[mask]
+
+        # Sort by |correlation| descending before building the dicts, so
+        # no Python-level sort over dictionaries is needed
+        order = np.argsort(-pair_values[mask], kind='stable')
+
+        return [
+            {
+                'column_1': str(columns[row_idx[k]]),
+                'column_2': str(columns[col_idx[k]]),
+                'correlation': round(float(corr[row_idx[k], col_idx[k]]), 3)
+            }
+            for k in order
+        ]
+    
+    def get_frequency_distribution(self, column):
+        """
+        Get frequency distribution for a column
+        
+        Args:
+            column: Column name
+        
+        Returns:
+            Dictionary with value counts
+        """
+        if column not in self.df.columns:
+            return {}
+
+        col_data = self.df[column]
+
+        if isinstance(col_data.dtype, pd.CategoricalDtype):
+            # Categoricals already count over integer codes internally
+            items = col_data.value_counts().items()
+        else:
+            # Count over factorized codes with a bincount instead of the
+            # generic value_counts hash table
+            codes, uniques = pd.factorize(col_data)
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            order = np.argsort(-counts, kind='stable')
+            items = ((uniques[i], counts[i]) for i in order)
+
+        dist = {}
+        for value, count in items:
+            dist[str(value)] = {
+                'count': int(count),
+                'percentage': round(100 * int(count) / len(self.df), 2)
+            }
+
+        return dist
+    
+    def get_categorical_summary(self):
+        """
+        Get summary of categorical columns
+        
+        Returns:
+            Dictionary with categorical column information
+        """
+        categorical_cols = list(self.df.select_dtypes(include=['object', 'category']).columns)
+        null_counts = self._get_null_counts()
+
+        def summarize(col):
+            # One hash-based scan per column; the first value_counts row
+            # is the mode, so separate mode()/nunique() calls are redundant
+            value_counts = self.df[col].value_counts()
+
+            # Convert most_common counts to int
+            most_common = {str(k): int(v) for k, v in value_counts.head(5).items()}
+
+            return {
+                'unique_values': int(len(value_counts)),
+                'top_value': str(value_counts.index[0]) if len(value_counts) > 0 else None,
+                'top_value_count': int(value_counts.iloc[0]) if len(value_counts) > 0 else 0,
+                'null_count': int(null_counts[col]),
+                'most_common': most_common
+            }
+
+        results = self._map_columns(summarize, categorical_cols)
+
+        return dict(zip(categorical_cols, results))
+    
+    def get_distribution_shape(self, column):
+        """
+        Get distribution shape information for numeric column
+        
+        Args:
+            column: Column name
+        
+        Returns:
+            Dictionary with distribution characteristics
+        """
+        if column not in self.df.columns or not pd.api.types.is_numeric_dtype(self.df[column]):
+            return {}
+        
+        col_data = self.df[column].dropna()
+        skewness = float(col_data.skew())
+        kurtosis = float(col_data.kurtosis())
+
+        return {
+            'mean': self._json_round(col_data.mean()),
+            'median': self._json_round(col_data.median()),
+            'mode': self._json_round(col_data.mode()[0]) if len(col_data.mode()) > 0 else None,
+            'skewness': self._json_round(skewness),
+            'kurtosis': self._json_round(kurtosis),
+            'is_normal': abs(skewness) < 0.5 and abs(kurtosis) < 3
+        }
+    
+    def get_column_insights(self, column):
+        """
+        Get detailed insights for a specific column
+        
+        Args:
+            column: Column name
+        
+        Returns:
+            Dictionary with column insights
+        """
+        from utils import infer_column_type
+        
+        if column not in self.df.columns:
+            return {}
+        
+        col_data = self.df[column]
+        inferred_type = infer_column_type(col_data)
+        null_count = int(self._get_null_counts()[column])
+        # One hashtable pass serves both derived facts
+        unique_count = int(col_data.nunique())
+
+        insights = {
+            'column_name': column,
+            'data_type': str(col_data.dtype),
+            'inferred_type': inferred_type,
+            'total_values': len(col_data),
+            'null_count': null_count,
+            'null_percentage': round(100 * null_count / len(col_data), 2),
+            'unique_values': unique_count,
+            'duplicates': int(len(col_data) - unique_count)
+        }
+        
+        if inferred_type == 'numeric':
+            insights['numeric_stats'] = self.get_summary_stats().get(column, {})
+            insights['distribution'] = self.get_distribution_shape(column)
+        
+        elif inferred_type == 'categorical':
+            insights['frequency_distribution'] = self.get_frequency_distribution(column)
+            insights['top_5_values'] = dict(col_data.value_counts().head(5))
+        
+        return insights
+    
+    def _count_duplicate_rows(self):
+        """
+        Count duplicate rows (all occurrences after the first)
+
+        Returns:
+            Number of duplicate rows as int
+        """
+        return self.features.duplicate_row_count
+
+    def get_overall_summary(self):
+        """
+        Get overall dataset summary
+        
+        Returns:
+            Dictionary with dataset overview
+        """
+        total_nulls = int(self._get_null_counts().sum())
+
+        summary = {
+            'total_rows': int(len(self.df)),
+            'total_columns': int(len(self.df.columns)),
+            'total_cells': int(len(self.df) * len(self.df.columns)),
+            'null_cells': total_nulls,
+            'null_percentage': round(float(100 * total_nulls /
+                                    (len(self.df) * len(self.df.columns))), 2),
+            'duplicate_rows': self._count_duplicate_rows(),
+            'memory_usage_bytes': self._get_memory_bytes(),
+            'numeric_columns': int(len(self.df.select_dtypes(include=[np.number]).columns)),
+            'categorical_columns': int(len(self.df.select_dtypes(include=['object', 'category']).columns)),
+            'column_names': [str(col) for col in self.df.columns]
+        }
+        
+        return summary
+    
+    def generate_analysis_report(self):
+        """
+        Generate comprehensive analysis report
+        
+        Returns:
+            Complete analysis report
+        """
+        report = {
+            'overview': self.get_overall_summary(),
+            'summary_stats': self.get_summary_stats(),
+            'null_distribution': self.get_null_distribution(),
+            'correlation_matrix': self.get_correlation_matrix(),
+            'high_correlations': self.get_high_correlations(),
+            'categorical_summary': self.get_categorical_summary()
+        }
+        
+        return report
@@ -0,0 +1,420 @@
+"""
+cleaner.py - Data cleaning functions for CSV files
+"""
+
+import re
+
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Any
+
+# Optional pyarrow compute kernels for fast string cleaning
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except Exception:
+    pa = None
+    pc = None
+    HAS_PYARROW = False
+
+# Optional polars for parallel duplicate hashing
+try:
+    import polars as pl
+    HAS_POLARS = True
+except Exception:
+    pl = None
+    HAS_POLARS = False
+
+# pandas >= 3 always runs with copy-on-write; opt in explicitly on 2.x so
+# the cleaner can hold lightweight references instead of eager copies
+if int(pd.__version__.split('.')[0]) < 3:
+    try:
+        pd.set_option('mode.copy_on_write', True)
+        HAS_COW = True
+    except Exception:
+        HAS_COW = False
+else:
+    HAS_COW = True
+
+
+class CSVCleaner:
+    """Perform data cleaning operations on CSV files"""
+
+    # Matches characters that are neither word characters nor underscore
+    _INVALID_NAME_CHARS = re.compile(r'\W')
+
+    def __init__(self, df):
+        """
+        Initialize the cleaner
+        
+        Args:
+            df: pandas DataFrame to clean
+        """
+        # Under copy-on-write a shallow copy shares the column buffers;
+        # any mutation copies only the affected columns, so the two eager
+        # deep copies are unnecessary
+        if HAS_COW:
+            self.df = df.copy(deep=False)
+            self.original_df = df.copy(deep=False)
+        else:
+            self.df = df.copy()
+            self.original_df = df.copy()
+        self.changes = []
+
+    def reset(self):
+        """Reset to original DataFrame"""
+        self.df = self.original_df.copy(deep=False) if HAS_COW else self.original_df.copy()
+        self.changes = []
+    
+    def get_changes(self):
+        """Return list of changes made"""
+        return self.changes
+
+    @staticmethod
+    def _string_op(series, kernel, fallback):
+        """
+        Apply an Arrow compute string kernel to a Series
+
+        Uses the vectorized C++ kernel when pyarrow is available, falling
+        back to the pandas .str accessor otherwise.
+
+        Args:
+            series: pandas Series to transform
+            kernel: Name of the Arrow compute function (e.g. 'utf8_lower')
+            fallback: Callable applied to the Series when pyarrow is
+                      unavailable or the conversion fails
+
+        Returns:
+            Transformed pandas Series
+        """
+        if HAS_PYARROW:
+            try:
+                arr = pa.array(series, from_pandas=True)
+                result = pc.call_function(kernel, [arr])
+                return pd.Series(
+                    result.to_pandas().to_numpy(),
+                    index=series.index,
+                    name=series.name
+                )
+            except Exception:
+                pass
+
+        return fallback(series)
+    
+    def remove_empty_rows(self):
+        """
+        Remove rows where all values are null
+        
+        Returns:
+            Self for method chaining
+        """
+        initial_rows = len(self.df)
+
+        # Reduce the raw boolean mask with NumPy instead of dropna(how='all')
+        keep = ~self.df.isna().to_numpy().all(axis=1)
+        if not keep.all():
+            self.df = self.df.loc[keep]
+        removed = initial_rows - len(self.df)
+
+        if removed > 0:
+            self.changes.append(f"Removed {removed} completely empty rows")
+
+        return self
+    
+    def remove_empty_columns(self):
+        """
+        Remove columns where all values are null
+        
+        Returns:
+            Self for method chaining
+        """
+        initial_cols = len(self.df.columns)
+
+        keep = ~self.df.isna().to_numpy().all(axis=0)
+        if not keep.all():
+            self.df = self.df.loc[:, keep]
+        removed = initial_cols - len(self.df.columns)
+        
+        if removed > 0:
+            self.changes.append(f"Removed {removed} completely empty columns")
+        
+        return self
+    
+    def trim_whitespace(self, columns=None):
+        """
+        Trim leading/trailing whitespace
+        
+        Args:
+            columns: Specific columns to clean (None = all string columns)
+        
+        Returns:
+            Self for method chaining
+        """
+        if columns is None:
+            columns = self.df.select_dtypes(include=['object', 'category']).columns
+
+        for col in columns:
+            if col in self.df.columns:
+                self.df[col] = self._string_op(
+                    self.df[col], 'utf8_trim_whitespace', lambda s: s.str.strip()
+                )
+
+        self.changes.append(f"Trimmed whitespace from {len(columns)} columns")
+        return self
+    
+    def remove_duplicates(self, subset=None, keep='first'):
+        """
+        Remove duplicate rows
+        
+        Args:
+            subset: Specific columns to consider for duplicates
+            keep: 'first', 'last', or False (remove all duplicates)
+        
+        Returns:
+            Self for method chaining
+        """
+        initial_rows = len(self.df)
+
+        keep_mask = self._duplicate_keep_mask(subset, keep)
+        if keep_mask is not None:
+            self.df = self.df.loc[keep_mask]
+        else:
+            self.df = self.df.drop_duplicates(subset=subset, keep=keep)
+        removed = initial_rows - len(self.df)
+
+        if removed > 0:
+            self.changes.append(f"Removed {removed} duplicate rows")
+
+        return self
+
+    def _duplicate_keep_mask(self, subset, keep):
+        """
+        Compute the drop-duplicates keep mask with polars' parallel hashing
+
+        Args:
+            subset: Columns considered for duplicates (None = all)
+            keep: 'first', 'last', or False
+
+        Returns:
+            Boolean ndarray of rows to keep (index/order preserved by the
+            caller via .loc), or None when polars is unavailable
+        """
+        if not HAS_POLARS:
+            return None
+
+        try:
+            if subset is None:
+                cols = self.df
+            else:
+                if isinstance(subset, str):
+                    subset = [subset]
+                cols = self.df[list(subset)]
+            rows = pl.from_pandas(cols).select(row=pl.struct(pl.all()))['row']
+
+            if keep == 'first':
+                mask = rows.is_first_distinct()
+            elif keep == 'last':
+                mask = rows.is_last_distinct()
+            elif keep is False:
+                mask = ~rows.is_duplicated()
+            else:
+                return None
+
+            return mask.to_numpy()
+        except Exception:
+            return None
+    
+    def fill_missing_values(self, method='mean', columns=None, fill_value=None):
+        """
+        Fill missing values using specified method
+        
+        Args:
+            method: 'mean', 'median', 'mode', 'forward_fill', 'backward_fill', or 'value'
+            columns: Specific columns to fill (None = all)
+            fill_value: Value to use when method='value'
+        
+        Returns:
+            Self for method chaining
+        """
+        if columns is None:
+            columns = self.df.columns
+
+        columns = [col for col in columns if col in self.df.columns]
+        initial_nulls = self.df[columns].isna().sum().sum()
+
+        if method in ('mean', 'median'):
+            numeric = self.df[columns].select_dtypes(include=[np.number])
+            fills = numeric.mean() if method == 'mean' else numeric.median()
+            fills = fills.dropna()
+            if len(fills) > 0:
+                self.df.fillna(fills.to_dict(), inplace=True)
+
+        elif method == 'mode':
+            modes = self.df[columns].mode()
+            if len(modes) > 0:
+                fills = modes.iloc[0].dropna()
+                if len(fills) > 0:
+                    self.df.fillna(fills.to_dict(), inplace=True)
+
+        elif method == 'forward_fill':
+            self.df[columns] = self.df[columns].ffill()
+
+        elif method == 'backward_fill':
+            self.df[columns] = self.df[columns].bfill()
+
+        elif method == 'value' and fill_value is not None:
+            self.df[columns] = self.df[columns].fillna(fill_value)
+
+        final_nulls = self.df[columns].isna().sum().sum()
+        filled = initial_nulls - final_nulls
+        
+        if filled > 0:
+            self.changes.append(f"Filled {filled} missing values using {method}")
+        
+        return self
+    
+    def standardize_column_names(self):
+        """
+        Standardize column names (lowercase, no spaces, remove special chars)
+        
+        Returns:
+            Self for method chaining
+        """
+        new_columns = {}
+        for col in self.df.columns:
+            new_col = str(col).lower().strip().replace(' ', '_')
+            # Single C-level regex scan instead of a per-character
+            # Python generator
+            new_columns[col] = self._INVALID_NAME_CHARS.sub('', new_col)
+        
+        self.df.rename(columns=new_columns, inplace=True)
+        self.changes.append("Standardized column names")
+        return self
+    
+    def normalize_text_case(self, columns=None, case='lower'):
+        """
+        Normalize text case in specified columns
+        
+        Args:
+            columns: Columns to normalize
+            case: 'lower', 'upper', or 'title'
+        
+        Returns:
+            Self for method chaining
+        """
+        if columns is None:
+            columns = self.df.select_dtypes(include=['object', 'category']).columns
+
+        case_ops = {
+            'lower': ('utf8_lower', lambda s: s.str.lower()),
+            'upper': ('utf8_upper', lambda s: s.str.upper()),
+            'title': ('utf8_title', lambda s: s.str.title())
+        }
+
+        for col in columns:
+            if col in self.df.columns and case in case_ops:
+                kernel, fallback = case_ops[case]
+                self.df[col] = self._string_op(self.df[col], kernel, fallback)
+        
+        self.changes.append(f"Normalized text case to {case} in {len(columns)} columns")
+        return self
+    
+    def remove_outliers(self, columns=None, method='iqr', threshold=1.5):
+        """
+        Remove outliers from numeric columns
+        
+        Args:
+            columns: Numeric columns to process
+            method: 'iqr' (Interquartile Range) or 'zscore'
+            threshold: IQR multiplier (1.5) or zscore threshold (3)
+        
+        Returns:
+            Self for method chaining
+        """
+        if columns is None:
+            columns = self.df.select_dtypes(include=[np.number]).columns
+        
+        initial_rows = len(self.df)
+        
+        for col in columns:
+            if col not in self.df.columns:
+                continue
+            
+            if method == 'iqr':
+                arr = self.df[col].dropna().to_numpy(dtype=np.float64)
+                if arr.size == 0:
+                    continue
+                # Both quantiles in a single introselect pass
+                Q1, Q3 = np.quantile(arr, [0.25, 0.75])
+                IQR = Q3 - Q1
+                lower_bound = Q1 - threshold * IQR
+                upper_bound = Q3 + threshold * IQR
+                self.df = self.df[(self.df[col] >= lower_bound) & (self.df[col] <= upper_bound)]
+            
+            elif method == 'zscore':
+                arr = self.df[col].to_numpy(dtype=np.float64)
+                mean = np.nanmean(arr)
+                std = np.nanstd(arr)
+                if std == 0 or np.isnan(std):
+                    continue
+                # NaNs score 0 (kept), matching the old fill-with-mean trick
+                z_scores = np.abs((np.where(np.isnan(arr), mean, arr) - mean) / std)
+                self.df = self.df[z_scores < threshold]
+        
+        removed = initial_rows - len(self.df)
+        if removed > 0:
+            self.changes.append(f"Removed {removed} outlier rows using {method}")
+        
+        return self
+    
+    def convert_dtypes(self, columns_types: Dict[str, str]):
+        """
+        Convert column data types
+        
+        Args:
+            columns_types: Dictionary of {column: dtype} to convert
+        
+        Returns:
+            Self for method chaining
+        """
+        requested = {col: dtype for col, dtype in columns_types.items()
+                     if col in self.df.columns}
+
+        # Batch numeric/datetime targets into one dispatch per converter
+        # instead of one call per column
+        numeric_cols = [col for col, dtype in requested.items() if dtype == 'numeric']
+        datetime_cols = [col for col, dtype in requested.items() if dtype == 'datetime']
+        other = {col: dtype for col, dtype in requested.items()
+                 if dtype not in ('numeric', 'datetime')}
+
+        for cols, converter, dtype in (
+            (numeric_cols, pd.to_numeric, 'numeric'),
+            (datetime_cols, pd.to_datetime, 'datetime')
+        ):
+            if not cols:
+                continue
+            try:
+                self.df[cols] = self.df[cols].apply(converter, errors='coerce')
+            except Exception:
+                # Retry per column so one bad column doesn't block the rest
+                for col in cols:
+                    try:
+                        self.df[col] = converter(self.df[col], errors='coerce')
+                    except Exception as e:
+                        self.changes.append(f"Warning: Could not convert {col} to {dtype}: {str(e)}")
+
+        for col, dtype in other.items():
+            try:
+                if dtype in ['string', 'object']:
+                    self.df[col] = self.df[col].astype(str)
+                else:
+                    self.df[col] = self.df[col].astype(dtype)
+            except Exception as e:
+                self.changes.append(f"Warning: Could not convert {col} to {dtype}: {str(e)}")
+
+        return self
+    
+    def get_cleaned_df(self):
+        """Return the cleaned DataFrame"""
+        return self.df
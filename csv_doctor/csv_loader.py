@@ -0,0 +1,262 @@
+"""
+csv_loader.py - Load and parse CSV files using pandas
+"""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+# Optional polars engine for faster, multi-threaded CSV parsing
+try:
+    import polars as pl
+    HAS_POLARS = True
+except Exception:
+    pl = None
+    HAS_POLARS = False
+
+# pandas' default NA sentinels ('NA', 'NULL', 'NaN', ...), passed to the
+# polars reader so both engines null the same markers and agree on
+# column dtypes
+try:
+    from pandas._libs.parsers import STR_NA_VALUES as _NA_SENTINELS
+except Exception:
+    _NA_SENTINELS = {
+        '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN',
+        '-nan', '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN',
+        'None', 'n/a', 'nan', 'null'
+    }
+
+
+class CSVLoader:
+    """Load and parse CSV files"""
+    
+    def __init__(self, filepath):
+        """
+        Initialize the CSV loader
+        
+        Args:
+            filepath: Path to the CSV file
+        """
+        self.filepath = Path(filepath)
+        self.df = None
+        self.metadata = {}
+        self._downcast_savings = None
+    
+    def load(self, encoding='utf-8', sep=None, downcast=False, **kwargs):
+        """
+        Load CSV file with automatic delimiter detection
+
+        Uses the multi-threaded polars CSV reader when available (bridged
+        back to pandas), falling back to pandas read_csv otherwise.
+
+        Args:
+            encoding: File encoding (default: utf-8)
+            sep: Delimiter (auto-detect if None)
+            downcast: Shrink numeric dtypes and convert low-cardinality
+                      text columns to category after loading
+            **kwargs: Additional pandas read_csv parameters
+
+        Returns:
+            pandas DataFrame
+        """
+        try:
+            if sep is None:
+                sep = self._sniff_delimiter(encoding)
+
+            self.df = None
+
+            # polars only handles UTF-8; custom pandas kwargs also force
+            # the pandas path
+            if HAS_POLARS and not kwargs and encoding.lower() in ('utf-8', 'utf8'):
+                try:
+                    pldf = pl.read_csv(self.filepath, separator=sep, encoding='utf8',
+                                       null_values=list(_NA_SENTINELS))
+                    self.df = pldf.to_pandas()
+                except Exception:
+                    self.df = None
+
+            if self.df is None:
+                self.df = pd.read_csv(
+                    self.filepath,
+                    encoding=encoding,
+                    sep=sep,
+                    **kwargs
+                )
+
+            if downcast:
+                self._downcast_dtypes()
+
+            self._extract_metadata()
+            return self.df
+
+        except Exception as e:
+            raise ValueError(f"Error loading CSV: {str(e)}")
+
+    def _downcast_dtypes(self):
+        """
+        Shrink column dtypes to reduce memory footprint
+
+        Integer columns are narrowed to the smallest sufficient integer
+        type, float columns to float32 (lossy, hence opt-in via
+        load(downcast=True)), and low-cardinality text columns become
+        category. The savings are recorded in the metadata.
+        """
+        before = int(self.df.memory_usage(deep=True).sum())
+
+        for col in self.df.columns:
+            dtype = self.df[col].dtype
+
+            if pd.api.types.is_integer_dtype(dtype):
+                self.df[col] = pd.to_numeric(self.df[col], downcast='integer')
+            elif pd.api.types.is_float_dtype(dtype):
+                self.df[col] = pd.to_numeric(self.df[col], downcast='float')
+            elif pd.api.types.is_object_dtype(dtype) or \
+                    pd.api.types.is_string_dtype(dtype):
+                col_data = self.df[col]
+                if len(col_data) > 0 and col_data.nunique() / len(col_data) < 0.5:
+                    self.df[col] = col_data.astype('category')
+
+        after = int(self.df.memory_usage(deep=True).sum())
+        self._downcast_savings = before - after
+    
+    def _sniff_delimiter(self, encoding='utf-8'):
+        """
+        Detect the delimiter from a bounded raw read of the header
+
+        Avoids decoding arbitrarily long first lines through
+        io.TextIOWrapper by reading at most 64 KiB of raw bytes.
+
+        Args:
+            encoding: File encoding used to decode the header
+
+        Returns:
+            Detected delimiter character
+        """
+        with open(self.filepath, 'rb') as f:
+            chunk = f.read(65536)
+        newline_idx = chunk.find(b'\n')
+        header = chunk if newline_idx == -1 else chunk[:newline_idx]
+        return self._detect_delimiter(header.decode(encoding, errors='replace'))
+
+    def scan(self, sep=None):
+        """
+        Lazily scan the CSV as a polars LazyFrame
+
+        Unlike load(), nothing is materialized: the returned LazyFrame
+        streams the file chunk-wise when collected, so aggregations over
+        files larger than RAM complete instead of OOMing.
+
+        Args:
+            sep: Delimiter (auto-detect if None)
+
+        Returns:
+            polars LazyFrame over the CSV
+
+        Raises:
+            ImportError: If polars is not installed
+        """
+        if not HAS_POLARS:
+            raise ImportError("polars is required for streaming CSV scans")
+
+        if sep is None:
+            sep = self._sniff_delimiter()
+
+        return pl.scan_csv(self.filepath, separator=sep)
+
+    @staticmethod
+    def _detect_delimiter(line):
+        """
+        Detect the most likely delimiter
+
+        Counts all candidate delimiters in a single byte-histogram pass
+        (np.bincount) instead of one str.count scan per candidate.
+
+        Args:
+            line: First line of CSV file
+
+        Returns:
+            Detected delimiter (comma, semicolon, tab, or pipe)
+        """
+        delimiters = [',', ';', '\t', '|']
+
+        buf = np.frombuffer(line.encode('utf-8'), dtype=np.uint8)
+        counts = np.bincount(buf, minlength=128)
+
+        sep_counts = [counts[ord(sep)] for sep in delimiters]
+        if max(sep_counts) == 0:
+            return ','
+
+        return delimiters[int(np.argmax(sep_counts))]
+    
+    def _extract_metadata(self):
+        """Extract metadata from loaded CSV"""
+        if self.df is not None:
+            # Convert dtypes to strings to avoid JSON serialization issues
+            dtypes_dict = {col: str(dtype) for col, dtype in self.df.dtypes.items()}
+            self.metadata = {
+                'file_name': self.filepath.name,
+                'file_size': self.filepath.stat().st_size,
+                'rows': len(self.df),
+                'columns': len(self.df.columns),
+                'column_names': list(self.df.columns),
+                'dtypes': dtypes_dict,
+                'memory_usage': int(self.df.memory_usage(deep=True).sum())
+            }
+            if self._downcast_savings is not None:
+                self.metadata['downcast_savings_bytes'] = self._downcast_savings
+    
+    def get_metadata(self):
+        """Return file metadata"""
+        return self.metadata
+    
+    def validate_structure(self):
+        """
+        Validate CSV structure
+        
+        Returns:
+            Dictionary with validation results
+        """
+        validation = {
+            'is_valid': True,
+            'issues': []
+        }
+        
+        if self.df is None:
+            validation['is_valid'] = False
+            validation['issues'].append('CSV not loaded')
+            return validation
+        
+        # Check for empty DataFrame
+        if len(self.df) == 0:
+            validation['issues'].append('CSV is empty')
+        
+        # Check for empty columns
+        empty_cols = [col for col in self.df.columns if self.df[col].isna().all()]
+        if empty_cols:
+            validation['issues'].append(f'Empty columns found: {empty_cols}')
+        
+        # Check for unnamed columns
+        unnamed_cols = [col for col in self.df.columns if 'Unnamed' in str(col)]
+        if unnamed_cols:
+            validation['issues'].append(f'Unnamed columns found: {unnamed_cols}')
+        
+        return validation
+    
+    def get_sample(self, n=5):
+        """Get first n rows of CSV"""
+        return self.df.head(n).to_dict('records') if self.df is not None else []
+    
+    @staticmethod
+    def from_string(csv_string, **kwargs):
+        """
+        Load CSV from string
+        
+        Args:
+            csv_string: CSV content as string
+            **kwargs: Additional pandas read_csv parameters
+        
+        Returns:
+            pandas DataFrame
+        """
+        from io import StringIO
+        return pd.read_csv(StringIO(csv_string), **kwargs)
@@ -0,0 +1,138 @@
+"""
+features.py - Shared per-DataFrame feature cache
+"""
+
+import numpy as np
+import pandas as pd
+
+# Optional polars for parallel duplicate hashing
+try:
+    import polars as pl
+    HAS_POLARS = True
+except Exception:
+    pl = None
+    HAS_POLARS = False
+
+
+class DataFrameFeatures:
+    """Lazily computed facts about one DataFrame
+
+    CSVAnalyzer and CSVValidator both need null counts, unique counts
+    and duplicate-row statistics. Passing one instance of this class to
+    both turns their duplicated full-frame scans into a single pass per
+    fact; each fact is computed on first access and cached.
+    """
+
+    def __init__(self, df):
+        """
+        Initialize the feature cache
+
+        Args:
+            df: pandas DataFrame the facts describe
+        """
+        self.df = df
+        self._isna_mask = None
+        self._null_counts = None
+        self._null_row_mask = None
+        self._nunique = None
+        self._duplicated_mask = None
+        self._duplicate_row_count = None
+
+    @property
+    def isna_mask(self):
+        """Boolean DataFrame marking null cells"""
+        if self._isna_mask is None:
+            self._isna_mask = self.df.isna()
+        return self._isna_mask
+
+    def _scan_nulls(self):
+        """Fill null_counts and null_row_mask in one streaming pass
+
+        Goes column by column, accumulating the per-column counts and
+        OR-ing each column's null positions into a single row-length
+        vector. The working set stays O(rows) instead of the full
+        rows x columns mask that isna().any(axis=1) would allocate.
+        """
+        counts = {}
+        row_mask = np.zeros(len(self.df), dtype=bool)
+        for col in self.df.columns:
+            col_na = self.df[col].isna().to_numpy()
+            counts[col] = int(col_na.sum())
+            np.logical_or(row_mask, col_na, out=row_mask)
+        self._null_counts = pd.Series(counts, dtype='int64')
+        self._null_row_mask = row_mask
+
+    @property
+    def null_counts(self):
+        """Per-column null counts as a Series"""
+        if self._null_counts is None:
+            if self._isna_mask is not None:
+                self._null_counts = self._isna_mask.sum()
+            else:
+                self._scan_nulls()
+        return self._null_counts
+
+    @property
+    def null_row_mask(self):
+        """Boolean array marking rows that contain at least one null"""
+        if self._null_row_mask is None:
+            if self._isna_mask is not None:
+                self._null_row_mask = self._isna_mask.any(axis=1).to_numpy()
+            else:
+                self._scan_nulls()
+        return self._null_row_mask
+
+    @property
+    def nunique(self):
+        """Per-column distinct (non-null) value counts as a Series"""
+        if self._nunique is None:
+            self._nunique = self.df.nunique()
+        return self._nunique
+
+    @property
+    def duplicated_first_mask(self):
+        """Boolean Series marking duplicate rows, first occurrences excluded
+
+        keep='first' is the cheapest duplicated() variant; the keep=False
+        row count can be derived from it (see duplicated_any_count), so no
+        second full-frame hashing pass is ever needed.
+        """
+        if self._duplicated_mask is None:
+            self._duplicated_mask = self.df.duplicated()
+        return self._duplicated_mask
+
+    @property
+    def duplicated_any_count(self):
+        """Number of rows that have at least one identical twin
+
+        Equals the keep=False duplicated() count: every flagged non-first
+        occurrence plus one first occurrence per duplicate group. The
+        group count is recovered by deduplicating only the flagged rows,
+        which is tiny compared to rescanning the whole frame.
+        """
+        mask = self.duplicated_first_mask
+        extra = int(mask.sum())
+        if extra == 0:
+            return 0
+        groups = int(len(self.df[mask].drop_duplicates()))
+        return extra + groups
+
+    @property
+    def duplicate_row_count(self):
+        """
+        Number of duplicate rows (all occurrences after the first)
+
+        Uses polars' multi-threaded hashing when available instead of
+        pandas' single-threaded duplicated().
+        """
+        if self._duplicate_row_count is None:
+            count = None
+            if HAS_POLARS:
+                try:
+                    count = int(len(self.df) - pl.from_pandas(self.df).n_unique())
+                except Exception:
+                    count = None
+            if count is None:
+                count = int(self.duplicated_first_mask.sum())
+            self._duplicate_row_count = count
+        return self._duplicate_row_count
@@ -0,0 +1,989 @@
+"""
+main.py - Flask application for CSV Doctor
+Entry point with routes for upload, clean, analyze, and export
+"""
+
+from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
+from flask.json.provider import JSONProvider
+import functools
+import os
+import shutil
+import threading
+import uuid
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from werkzeug.utils import secure_filename
+import traceback
+from cachetools import Cache, TTLCache
+
+# Optional pyarrow for columnar (C++) CSV writing on export
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import feather
+    HAS_PYARROW = True
+except Exception:
+    pa = None
+    pa_csv = None
+    feather = None
+    HAS_PYARROW = False
+
+# Optional orjson for fast C-level JSON responses with native NumPy support
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    orjson = None
+    HAS_ORJSON = False
+
+# Optional flask-compress for compressed API responses
+try:
+    from flask_compress import Compress
+    HAS_COMPRESS = True
+except Exception:
+    Compress = None
+    HAS_COMPRESS = False
+
+from csv_loader import CSVLoader
+from cleaner import CSVCleaner
+from features import DataFrameFeatures
+from validator import CSVValidator
+from analyzer import CSVAnalyzer
+from reporter import CSVReporter
+from visualizer import CSVVisualizer
+from utils import (
+    create_upload_dir, get_file_path, safe_filename,
+    format_bytes
+)
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson
+
+    Serializes NumPy scalars and arrays natively in C, so API payloads
+    full of numeric cells skip both the stdlib encoder and the Python
+    recursive sanitizer.
+    """
+
+    def dumps(self, obj, **kwargs):
+        # default=str mirrors the old sanitizer's last resort for types
+        # orjson doesn't know; NaN/Inf already serialize to null natively
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Initialize Flask app
+app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
+app.config['UPLOAD_FOLDER'] = 'uploads'
+if HAS_ORJSON:
+    app.json = OrjsonProvider(app)
+
+# Analysis/validation responses are large, highly redundant JSON; over a
+# network the transfer dominates latency, and zlib/brotli compress in C
+# while releasing the GIL
+if HAS_COMPRESS:
+    app.config.update(
+        COMPRESS_MIN_SIZE=4096,
+        COMPRESS_LEVEL=4,
+        COMPRESS_ALGORITHM=['br', 'gzip']
+    )
+    Compress(app)
+
+# Create upload directory
+create_upload_dir()
+
+# Detect optional export engines
+def _detect_optional_export_engines():
+    engines = {
+        'excel': False,
+        'parquet': False
+    }
+    try:
+        import openpyxl  # noqa: F401
+        engines['excel'] = True
+    except Exception:
+        engines['excel'] = False
+
+    try:
+        import pyarrow  # noqa: F401
+        engines['parquet'] = True
+    except Exception:
+        engines['parquet'] = False
+
+    return engines
+
+# Store export support info in app config, and pin the writer engines so
+# pandas skips its per-call engine autodetection
+app.config['EXPORT_SUPPORT'] = _detect_optional_export_engines()
+app.config['EXCEL_ENGINE'] = 'openpyxl' if app.config['EXPORT_SUPPORT']['excel'] else None
+app.config['PARQUET_ENGINE'] = 'pyarrow' if app.config['EXPORT_SUPPORT']['parquet'] else None
+
+# HTML export shell, resolved once at import instead of rebuilding a
+# multi-kilobyte f-string per request
+HTML_EXPORT_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #3498db; color: white; }}
+        tr:nth-child(even) {{ background-color: #f2f2f2; }}
+    </style>
+</head>
+<body>
+    <h1>Cleaned Data: {base}</h1>
+    <p>Total Rows: {rows} | Total Columns: {cols}</p>
+"""
+
+HTML_EXPORT_FOOTER = """
+</body>
+</html>
+"""
+
+class LockedTTLCache(TTLCache):
+    """TTLCache whose operations hold a re-entrant lock
+
+    cachetools caches are not thread-safe, and under the threaded
+    gunicorn deployment concurrent request threads read and mutate
+    these caches - a TTL sweep triggered from one thread can otherwise
+    corrupt a lookup running on another.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            return super().__contains__(key)
+
+    def __len__(self):
+        with self._lock:
+            return super().__len__()
+
+    # The compound operations check-then-act internally, so they must
+    # hold the lock across the whole call, not just each dunder
+    def get(self, key, default=None):
+        with self._lock:
+            return super().get(key, default)
+
+    def setdefault(self, key, default=None):
+        with self._lock:
+            return super().setdefault(key, default)
+
+    def pop(self, *args, **kwargs):
+        with self._lock:
+            return super().pop(*args, **kwargs)
+
+    def popitem(self):
+        with self._lock:
+            return super().popitem()
+
+    def expire(self, time=None):
+        with self._lock:
+            return super().expire(time)
+
+
+class SessionCache(LockedTTLCache):
+    """Size- and TTL-bounded session store
+
+    Evicted or expired sessions also remove their uploaded file from
+    disk, so neither memory nor the uploads directory grows without
+    bound.
+    """
+
+    @staticmethod
+    def _remove_upload(session):
+        """Delete the files belonging to a dropped session"""
+        for key in ('filepath', 'feather'):
+            path = session.get(key)
+            if path:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def __delitem__(self, key):
+        with self._lock:
+            try:
+                # Bypass the TTL check so already-expired entries can
+                # still be cleaned up
+                session = Cache.__getitem__(self, key)
+            except KeyError:
+                session = None
+
+            super().__delitem__(key)
+
+        if session is not None:
+            self._remove_upload(session)
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for _key, session in expired:
+            self._remove_upload(session)
+        return expired
+
+
+# Global storage for session data, bounded in count and age
+sessions = SessionCache(
+    maxsize=int(os.environ.get('CSVD_MAX_SESSIONS', 32)),
+    ttl=int(os.environ.get('CSVD_SESSION_TTL', 3600))
+)
+
+# Export jobs run off the request thread; pandas releases the GIL around
+# its C serialization paths, so several exports can overlap
+EXPORT_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+EXPORT_JOBS = LockedTTLCache(maxsize=128, ttl=3600)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_original_df(filepath, mtime):
+    """Reload an uploaded CSV from disk, cached on path and mtime"""
+    return CSVLoader(filepath).load()
+
+
+def _store_session_df(session_id, df):
+    """
+    Persist a session's DataFrame, spilling it to Feather when possible
+
+    Idle sessions otherwise keep their full DataFrame in process memory
+    between API calls. Spilled frames live in the uploads directory next
+    to the source file and are read back (memory-mapped) on demand, so a
+    cold session costs roughly zero RAM. Falls back to keeping the frame
+    in the session dict when pyarrow is unavailable or the frame can't
+    be converted.
+
+    Args:
+        session_id: Session identifier
+        df: pandas DataFrame to persist
+    """
+    session = sessions[session_id]
+
+    if HAS_PYARROW:
+        try:
+            # Never rewrite a spill file in place: frames materialized
+            # from it may still hold memory-mapped views, and truncating
+            # the mapping underneath them raises SIGBUS. Unlinking the
+            # old file instead keeps its inode alive for existing maps.
+            seq = session.get('feather_seq', 0) + 1
+            feather_path = str(Path(session['filepath']).with_suffix(f'.{seq}.feather'))
+            feather.write_feather(df, feather_path, compression='uncompressed')
+
+            old_path = session.get('feather')
+            session['feather'] = feather_path
+            session['feather_seq'] = seq
+            session.pop('df', None)
+            if old_path:
+                try:
+                    os.unlink(old_path)
+                except OSError:
+                    pass
+            return
+        except Exception:
+            session.pop('feather', None)
+
+    session['df'] = df
+
+
+def _get_session_df(session_id):
+    """
+    Materialize a session's DataFrame
+
+    Spilled sessions are read from their Feather file with memory
+    mapping, so repeated reads of a hot session come straight from the
+    OS page cache without a second in-heap copy of the raw buffers.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        pandas DataFrame
+    """
+    session = sessions[session_id]
+    if 'df' in session:
+        return session['df']
+
+    table = feather.read_table(session['feather'], memory_map=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _report_cache(session_id):
+    """
+    Get the per-session report cache, invalidated on DataFrame change
+
+    Analysis and validation reports are pure functions of the session's
+    DataFrame, so they are computed once per df_version (bumped by
+    /api/clean) and reused across /api/analyze, /api/validate and
+    /api/export/report.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        Mutable dict of cached report payloads for the current version
+    """
+    session = sessions[session_id]
+    version = session.get('df_version', 0)
+    cache = session.setdefault('report_cache', {})
+    if cache.get('version') != version:
+        cache.clear()
+        cache['version'] = version
+    return cache
+
+
+def get_original_df(session_id):
+    """
+    Get the as-uploaded DataFrame for a session
+
+    The original frame is not kept in memory; it is lazily re-read from
+    the uploaded file (and cached) when something needs it.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        pandas DataFrame, or None if the session is unknown
+    """
+    if session_id not in sessions:
+        return None
+
+    filepath = sessions[session_id]['filepath']
+    return _load_original_df(filepath, os.path.getmtime(filepath))
+
+
+@app.route('/')
+def index():
+    """Serve the main page"""
+    return render_template('index.html')
+
+
+@app.route('/api/upload', methods=['POST'])
+def upload_file():
+    """
+    Handle CSV file upload
+    
+    Returns:
+        JSON with upload status and file information
+    """
+    try:
+        if 'file' not in request.files:
+            return jsonify({'error': 'No file provided'}), 400
+        
+        file = request.files['file']
+        
+        if file.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+        
+        if not file.filename.lower().endswith('.csv'):
+            return jsonify({'error': 'Only CSV files are allowed'}), 400
+        
+        # Save file with timestamp, streaming in 1 MiB chunks instead of
+        # Werkzeug's default 16 KiB copy loop
+        filename = safe_filename(file.filename)
+        filepath = get_file_path(filename)
+        with open(filepath, 'wb') as f:
+            shutil.copyfileobj(file.stream, f, length=1 << 20)
+        
+        # Load and validate CSV. Downcasting at the door shrinks numeric
+        # columns and dictionary-encodes low-cardinality text, so every
+        # later pass (clean, validate, analyze, export) moves fewer bytes
+        loader = CSVLoader(str(filepath))
+        df = loader.load(downcast=True)
+        
+        metadata = loader.get_metadata()
+        validation = loader.validate_structure()
+        
+        # Store in session
+        session_id = f"session_{safe_filename(file.filename).replace('.csv', '')}"
+        sessions[session_id] = {
+            'filepath': str(filepath),
+            'filename': file.filename,
+            'metadata': metadata,
+            'df_version': 0
+        }
+        _store_session_df(session_id, df)
+        
+        return jsonify({
+            'success': True,
+            'session_id': session_id,
+            'filename': file.filename,
+            'metadata': metadata,
+            'validation': validation,
+            'sample': loader.get_sample()
+        })
+    
+    except Exception as e:
+        print(f"Upload error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/clean', methods=['POST'])
+def clean_data():
+    """
+    Clean CSV data based on provided options
+    
+    Returns:
+        JSON with cleaning results
+    """
+    try:
+        data = request.get_json()
+        session_id = data.get('session_id')
+        
+        if session_id not in sessions:
+            return jsonify({'error': 'Session not found'}), 400
+        
+        # CSVCleaner shallow-copies under copy-on-write, so the session's
+        # frame (when held in memory) can't be mutated through it
+        df = _get_session_df(session_id)
+        cleaner = CSVCleaner(df)
+        
+        # Apply cleaning operations based on options
+        options = data.get('options', {})
+        
+        if options.get('remove_empty_rows'):
+            cleaner.remove_empty_rows()
+        
+        if options.get('remove_empty_columns'):
+            cleaner.remove_empty_columns()
+        
+        if options.get('trim_whitespace'):
+            cleaner.trim_whitespace()
+        
+        if options.get('remove_duplicates'):
+            cleaner.remove_duplicates()
+        
+        if options.get('standardize_column_names'):
+            cleaner.standardize_column_names()
+        
+        if options.get('fill_missing'):
+            fill_method = options.get('fill_method', 'mean')
+            cleaner.fill_missing_values(method=fill_method)
+        
+        if options.get('normalize_text_case'):
+            case = options.get('text_case', 'lower')
+            cleaner.normalize_text_case(case=case)
+        
+        if options.get('remove_outliers'):
+            outlier_method = options.get('outlier_method', 'iqr')
+            cleaner.remove_outliers(method=outlier_method)
+        
+        # Get cleaned dataframe
+        cleaned_df = cleaner.get_cleaned_df()
+        
+        # Update session; bumping the version invalidates cached reports
+        _store_session_df(session_id, cleaned_df)
+        sessions[session_id]['changes'] = cleaner.get_changes()
+        sessions[session_id]['df_version'] = sessions[session_id].get('df_version', 0) + 1
+        
+        return jsonify({
+            'success': True,
+            'changes': cleaner.get_changes(),
+            'new_shape': {
+                'rows': len(cleaned_df),
+                'columns': len(cleaned_df.columns)
+            },
+            'sample': cleaned_df.head().to_dict('records')
+        })
+    
+    except Exception as e:
+        print(f"Clean error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/validate', methods=['POST'])
+def validate_data():
+    """
+    Validate CSV data quality
+    
+    Returns:
+        JSON with validation report
+    """
+    try:
+        data = request.get_json()
+        session_id = data.get('session_id')
+        
+        if session_id not in sessions:
+            return jsonify({'error': 'Session not found'}), 400
+        
+        df = _get_session_df(session_id)
+        cache = _report_cache(session_id)
+
+        # Generate reports (cached until the DataFrame changes)
+        if 'validation_report' not in cache:
+            validator = CSVValidator(df)
+            cache['validation_report'] = validator.generate_validation_report()
+            cache['quality_score'] = validator.get_data_quality_score()
+        validation_report = cache['validation_report']
+        quality_score = cache['quality_score']
+
+        # Reports are built from plain Python scalars with non-finite
+        # values already mapped to None, so no sanitation walk is needed
+        return jsonify({
+            'success': True,
+            'validation_report': validation_report,
+            'quality_score': quality_score
+        })
+    
+    except Exception as e:
+        print(f"Validation error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/analyze', methods=['POST'])
+def analyze_data():
+    """
+    Analyze CSV data
+    
+    Returns:
+        JSON with analysis results
+    """
+    try:
+        data = request.get_json()
+        session_id = data.get('session_id')
+        
+        if session_id not in sessions:
+            return jsonify({'error': 'Session not found'}), 400
+        
+        df = _get_session_df(session_id)
+        cache = _report_cache(session_id)
+
+        # Generate analysis report (cached until the DataFrame changes)
+        if 'analysis_report' not in cache:
+            cache['analysis_report'] = CSVAnalyzer(df).generate_analysis_report()
+        analysis_report = cache['analysis_report']
+
+        return jsonify({
+            'success': True,
+            'analysis': analysis_report
+        })
+    
+    except Exception as e:
+        print(f"Analysis error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/visualize', methods=['POST'])
+def visualize_data():
+    """
+    Generate visualizations
+    
+    Returns:
+        JSON with base64 encoded images
+    """
+    try:
+        data = request.get_json()
+        session_id = data.get('session_id')
+        
+        if session_id not in sessions:
+            return jsonify({'error': 'Session not found'}), 400
+        
+        df = _get_session_df(session_id)
+        visualizer = CSVVisualizer(df)
+
+        # Reuse per-column null counts from a cached validation report
+        # for this df_version, sparing the dashboard its only remaining
+        # full-frame isna pass
+        missing_counts = None
+        validation_report = _report_cache(session_id).get('validation_report')
+        if validation_report:
+            missing_counts = {
+                col: info['null_count']
+                for col, info in validation_report['null_distribution'].items()
+                if col != 'total'
+            }
+
+        # Generate dashboard images
+        images = visualizer.generate_dashboard_images(missing_counts=missing_counts)
+        
+        return jsonify({
+            'success': True,
+            'images': images
+        })
+    
+    except Exception as e:
+        print(f"Visualization error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+def _write_csv_export(df, export_path, sep=','):
+    """
+    Write the DataFrame as delimited text, preferring pyarrow's writer
+
+    pyarrow's columnar CSV writer formats numbers in C++ and is several
+    times faster than pandas' row-oriented writer on numeric-heavy
+    frames. Frames with bool or datetime columns take the pandas path:
+    pyarrow renders those as true/false and with microsecond suffixes,
+    which pd.read_csv would no longer round-trip to the original dtypes.
+    pandas also remains the fallback for frames pyarrow can't convert.
+
+    Args:
+        df: pandas DataFrame to write
+        export_path: Destination file path
+        sep: Field delimiter
+    """
+    formatting_sensitive = any(
+        pd.api.types.is_bool_dtype(dtype) or
+        pd.api.types.is_datetime64_any_dtype(dtype)
+        for dtype in df.dtypes
+    )
+
+    if HAS_PYARROW and not formatting_sensitive:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pa_csv.write_csv(table, str(export_path),
+                             pa_csv.WriteOptions(delimiter=sep))
+            return
+        except Exception:
+            pass
+
+    df.to_csv(export_path, index=False, sep=sep)
+
+
+def _write_export(df, export_format, base_name):
+    """
+    Write the DataFrame to disk in the requested format
+
+    Runs on the export pool, off the Flask request thread.
+
+    Args:
+        df: pandas DataFrame to export
+        export_format: One of csv, excel/xlsx, json, parquet, html, tsv
+        base_name: Uploaded filename without extension
+
+    Returns:
+        Tuple of (export_path, export_filename, mimetype)
+    """
+    if export_format == 'csv':
+        export_filename = f"cleaned_{base_name}.csv"
+        export_path = get_file_path(export_filename)
+        _write_csv_export(df, export_path)
+        mimetype = 'text/csv'
+
+    elif export_format == 'excel' or export_format == 'xlsx':
+        export_filename = f"cleaned_{base_name}.xlsx"
+        export_path = get_file_path(export_filename)
+        df.to_excel(export_path, index=False, sheet_name='Data',
+                    engine=app.config['EXCEL_ENGINE'])
+        mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+    elif export_format == 'json':
+        export_filename = f"cleaned_{base_name}.json"
+        export_path = get_file_path(export_filename)
+        # Serialize straight from the column arrays in C; Inf becomes
+        # NaN first so everything non-finite lands as null
+        df.replace([np.inf, -np.inf], np.nan).to_json(
+            export_path, orient='records', indent=2,
+            date_format='iso', force_ascii=False
+        )
+        mimetype = 'application/json'
+
+    elif export_format == 'parquet':
+        export_filename = f"cleaned_{base_name}.parquet"
+        export_path = get_file_path(export_filename)
+        df.to_parquet(export_path, index=False,
+                      engine=app.config['PARQUET_ENGINE'])
+        mimetype = 'application/octet-stream'
+
+    elif export_format == 'html':
+        export_filename = f"cleaned_{base_name}.html"
+        export_path = get_file_path(export_filename)
+        # Stream the table straight into the file instead of holding
+        # the full document (and a second copy of the table) in RAM
+        with open(export_path, 'w', buffering=1 << 20) as f:
+            f.write(HTML_EXPORT_HEADER.format(
+                title=export_filename, base=base_name,
+                rows=len(df), cols=len(df.columns)
+            ))
+            df.to_html(buf=f, index=False, border=0)
+            f.write(HTML_EXPORT_FOOTER)
+        mimetype = 'text/html'
+
+    else:  # tsv; unknown formats are rejected before the job is queued
+        export_filename = f"cleaned_{base_name}.tsv"
+        export_path = get_file_path(export_filename)
+        _write_csv_export(df, export_path, sep='\t')
+        mimetype = 'text/tab-separated-values'
+
+    return str(export_path), export_filename, mimetype
+
+
+def _start_export(session_id, export_format):
+    """
+    Validate an export request and queue it on the background pool
+
+    Shared by /api/export/data and the legacy /api/export/csv route, so
+    the latter doesn't need to fabricate a second request context.
+
+    Args:
+        session_id: Session identifier
+        export_format: One of csv, excel/xlsx, json, parquet, html, tsv
+
+    Returns:
+        Flask response: 202 with job URLs, or a 4xx/5xx error
+    """
+    try:
+        if session_id not in sessions:
+            return jsonify({'error': 'Session not found'}), 400
+
+        if export_format not in ('csv', 'excel', 'xlsx', 'json', 'parquet', 'html', 'tsv'):
+            return jsonify({'error': f'Unsupported format: {export_format}'}), 400
+
+        # Fail fast instead of letting pandas unwind a deep ImportError
+        if export_format in ('excel', 'xlsx') and not app.config['EXPORT_SUPPORT']['excel']:
+            return jsonify({'error': 'Excel export not available on this server'}), 400
+        if export_format == 'parquet' and not app.config['EXPORT_SUPPORT']['parquet']:
+            return jsonify({'error': 'Parquet export not available on this server'}), 400
+
+        df = _get_session_df(session_id)
+        filename = sessions[session_id]['filename']
+        base_name = filename.replace('.csv', '')
+
+        # Shallow copy: later cleaning on the session can't race with the
+        # serializer reading the columns
+        job_id = uuid.uuid4().hex
+        EXPORT_JOBS[job_id] = EXPORT_POOL.submit(
+            _write_export, df.copy(deep=False), export_format, base_name
+        )
+
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status_url': f'/api/export/status/{job_id}',
+            'download_url': f'/api/export/download/{job_id}'
+        }), 202
+
+    except Exception as e:
+        print(f"Export error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/export/data', methods=['POST'])
+def export_data():
+    """
+    Start exporting cleaned data in the requested format
+
+    The export runs on a background pool so a large Excel or HTML write
+    doesn't pin the request worker; the client polls the returned status
+    URL and then fetches the download URL.
+
+    Returns:
+        202 with job_id, status and download URLs
+    """
+    data = request.get_json()
+    return _start_export(data.get('session_id'), data.get('format', 'csv').lower())
+
+
+@app.route('/api/export/status/<job_id>', methods=['GET'])
+def export_status(job_id):
+    """Report the state of a background export job"""
+    future = EXPORT_JOBS.get(job_id)
+    if future is None:
+        return jsonify({'error': 'Job not found'}), 404
+
+    if not future.done():
+        return jsonify({'status': 'pending'})
+
+    error = future.exception()
+    if error is not None:
+        return jsonify({'status': 'failed', 'error': str(error)})
+
+    _path, export_filename, _mimetype = future.result()
+    return jsonify({'status': 'done', 'filename': export_filename})
+
+
+@app.route('/api/export/download/<job_id>', methods=['GET'])
+def export_download(job_id):
+    """Download the file produced by a finished export job"""
+    try:
+        future = EXPORT_JOBS.get(job_id)
+        if future is None:
+            return jsonify({'error': 'Job not found'}), 404
+
+        if not future.done():
+            return jsonify({'status': 'pending'}), 202
+
+        export_path, export_filename, mimetype = future.result()
+        return send_file(
+            export_path,
+            as_attachment=True,
+            download_name=export_filename,
+            mimetype=mimetype,
+            conditional=True
+        )
+
+    except Exception as e:
+        print(f"Export download error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/features', methods=['GET'])
+def get_features():
+    """Return available optional features (e.g., export support)"""
+    try:
+        return jsonify({'export_support': app.config.get('EXPORT_SUPPORT', {})})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/export/csv', methods=['POST'])
+def export_csv():
+    """
+    Legacy endpoint: Export cleaned CSV (delegates to the async export)
+
+    Returns:
+        202 with a job id plus status/download URLs; the CSV itself is
+        fetched from the download URL once the job reports done
+    """
+    try:
+        data = request.get_json()
+        return _start_export(data.get('session_id'), 'csv')
+
+    except Exception as e:
+        print(f"CSV Export error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/export/report', methods=['POST'])
+def export_report():
+    """
+    Export analysis report (Markdown or HTML)
+    
+    Returns:
+        Report file download
+    """
+    try:
+        data = request.get_json()
+        session_id = data.get('session_id')
+        report_format = data.get('format', 'md')  # 'md' or 'html'
+        
+        if session_id not in sessions:
+            return jsonify({'error': 'Session not found'}), 400
+        
+        df = _get_session_df(session_id)
+        filename = sessions[session_id]['filename']
+        
+        # Reuse reports already computed by /api/analyze and /api/validate;
+        # on a cold cache, share one feature scan between both passes
+        cache = _report_cache(session_id)
+        features = DataFrameFeatures(df)
+        if 'analysis_report' not in cache:
+            analyzer = CSVAnalyzer(df, features=features)
+            cache['analysis_report'] = analyzer.generate_analysis_report()
+        if 'validation_report' not in cache:
+            validator = CSVValidator(df, features=features)
+            cache['validation_report'] = validator.generate_validation_report()
+            cache['quality_score'] = validator.get_data_quality_score()
+
+        analysis_report = cache['analysis_report']
+        validation_report = dict(cache['validation_report'])
+        validation_report['quality_score'] = cache['quality_score']
+        
+        # Generate report
+        reporter = CSVReporter(df, filename)
+        markdown_report = reporter.generate_markdown_report(analysis_report, validation_report)
+        
+        # Save report
+        if report_format == 'html':
+            html_report = reporter.generate_html_report(markdown_report)
+            report_filename = f"report_{filename.replace('.csv', '.html')}"
+            export_path = get_file_path(report_filename)
+            
+            with open(export_path, 'w') as f:
+                f.write(html_report)
+            
+            return send_file(
+                str(export_path),
+                as_attachment=True,
+                download_name=report_filename,
+                mimetype='text/html',
+                conditional=True
+            )
+        else:
+            report_filename = f"report_{filename.replace('.csv', '.md')}"
+            export_path = get_file_path(report_filename)
+            
+            with open(export_path, 'w') as f:
+                f.write(markdown_report)
+            
+            return send_file(
+                str(export_path),
+                as_attachment=True,
+                download_name=report_filename,
+                mimetype='text/markdown',
+                conditional=True
+            )
+    
+    except Exception as e:
+        print(f"Report Export error: {traceback.format_exc()}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/session/<session_id>', methods=['GET'])
+def get_session_info(session_id):
+    """Get information about a session"""
+    try:
+        if session_id not in sessions:
+            return jsonify({'error': 'Session not found'}), 404
+        
+        session_data = sessions[session_id]
+        df = _get_session_df(session_id)
+        
+        return jsonify({
+            'session_id': session_id,
+            'filename': session_data['filename'],
+            'rows': len(df),
+            'columns': len(df.columns),
+            'column_names': list(df.columns)
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.errorhandler(413)
+def too_large(e):
+    """Handle file too large error"""
+    return jsonify({'error': 'File too large. Maximum size is 50MB'}), 413
+
+
+@app.errorhandler(404)
+def not_found(e):
+    """Handle 404 errors"""
+    return jsonify({'error': 'Not found'}), 404
+
+
+@app.errorhandler(500)
+def server_error(e):
+    """Handle 500 errors"""
+    return jsonify({'error': 'Internal server error'}), 500
+
+
+if __name__ == '__main__':
+    # Create necessary directories
+    Path('uploads').mkdir(exist_ok=True)
+    
+    # Run Flask app
+    app.run(debug=False, host='0.0.0.0', port=5000)
@@ -0,0 +1,356 @@
+"""
+reporter.py - Generate analysis reports (Markdown and HTML)
+"""
+
+import re
+from html import escape
+
+import pandas as pd
+from datetime import datetime
+from utils import sanitize_dict
+
+# Compiled once at import: Markdown constructs handled by the HTML report
+_MD_H1 = re.compile(r'^# (.+)$', re.MULTILINE)
+_MD_H2 = re.compile(r'^## (.+)$', re.MULTILINE)
+_MD_H3 = re.compile(r'^### (.+)$', re.MULTILINE)
+_MD_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_MD_HR = re.compile(r'^---$', re.MULTILINE)
+_MD_TABLE = re.compile(r'(?:^\|.*\|[ \t]*\n?)+', re.MULTILINE)
+
+# Optional tabulate backs DataFrame.to_markdown for fast table formatting
+try:
+    import tabulate  # noqa: F401
+    HAS_TABULATE = True
+except Exception:
+    HAS_TABULATE = False
+
+# HTML report shell, built once at import. A plain string with a body
+# placeholder needs no per-call f-string parsing or {{ }} brace escaping
+# around the CSS.
+_HTML_SHELL = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>CSV Doctor Report</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+            line-height: 1.6;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1, h2, h3 {
+            color: #2c3e50;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 10px;
+        }
+        h1 {
+            text-align: center;
+            color: #3498db;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+        th {
+            background-color: #3498db;
+            color: white;
+            padding: 12px;
+            text-align: left;
+        }
+        td {
+            padding: 10px;
+            border-bottom: 1px solid #ddd;
+        }
+        tr:hover {
+            background-color: #f5f5f5;
+        }
+        ul {
+            list-style-position: inside;
+        }
+        li {
+            margin: 8px 0;
+        }
+        strong {
+            color: #2c3e50;
+        }
+        hr {
+            border: none;
+            border-top: 2px solid #ecf0f1;
+            margin: 20px 0;
+        }
+        .footer {
+            text-align: center;
+            color: #7f8c8d;
+            font-size: 12px;
+            margin-top: 40px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <!-- BODY -->
+        <div class="footer">
+            <p>Report generated by CSV Doctor - Smart CSV Cleaner and Analyzer</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+class CSVReporter:
+    """Generate reports from CSV analysis"""
+
+    # Shared string constants: one interned object reused across reports
+    # instead of a fresh allocation per append
+    _HRULE = "\n---\n"
+    _CORR_HEADER = ("| Column 1 | Column 2 | Correlation |\n"
+                    "|----------|----------|-------------|")
+    _SCORE_HEADER = ("| Category | Score |\n"
+                     "|----------|-------|")
+
+    def __init__(self, df, filename="unknown"):
+        """
+        Initialize the reporter
+
+        Args:
+            df: pandas DataFrame
+            filename: Name of the CSV file
+        """
+        self.df = df
+        self.filename = filename
+        self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Constant across every report for this file: built once here
+        self._header_md = (f"# CSV Doctor - Analysis Report\n"
+                           f"\n**File:** {filename}\n"
+                           f"\n**Generated:** {self.timestamp}")
+    
+    @staticmethod
+    def _dict_table(data, columns, headers, percent_columns=()):
+        """
+        Format a mapping of row label -> field dict as Markdown table lines
+
+        Uses the tabulate-backed DataFrame.to_markdown (one formatting
+        call per table) when available instead of a per-row Python loop.
+
+        Args:
+            data: Dict of {row_label: {field: value}}
+            columns: Field names to include, in order
+            headers: Display names; the first entry labels the row key
+            percent_columns: Fields rendered with a trailing %
+
+        Returns:
+            List of Markdown table lines
+        """
+        if HAS_TABULATE:
+            table_df = pd.DataFrame.from_dict(data, orient='index')
+            table_df = table_df.reindex(columns=list(columns)).fillna(0)
+            for col in percent_columns:
+                table_df[col] = table_df[col].astype(str) + '%'
+            table_df.columns = list(headers[1:])
+            table_df.index.name = headers[0]
+            return table_df.to_markdown().split('\n')
+
+        lines = [
+            '| ' + ' | '.join(headers) + ' |',
+            '|' + '|'.join('---' for _ in headers) + '|'
+        ]
+        for key, info in data.items():
+            cells = [str(key)] + [
+                f"{info.get(col, 0)}%" if col in percent_columns else str(info.get(col, 0))
+                for col in columns
+            ]
+            lines.append('| ' + ' | '.join(cells) + ' |')
+        return lines
+
+    def generate_markdown_report(self, analysis_data, validation_data):
+        """
+        Generate Markdown report with analysis results
+        
+        Args:
+            analysis_data: Dictionary from analyzer
+            validation_data: Dictionary from validator
+        
+        Returns:
+            Markdown formatted report string
+        """
+        report = []
+
+        # Header (precomputed in __init__)
+        report.append(self._header_md)
+        report.append(self._HRULE)
+        
+        # Executive Summary
+        report.append("## 📊 Executive Summary\n")
+        overview = analysis_data.get('overview', {})
+        quality_score = validation_data.get('quality_score', {})
+        
+        report.append(f"- **Total Rows:** {overview.get('total_rows', 0):,}")
+        report.append(f"- **Total Columns:** {overview.get('total_columns', 0)}")
+        report.append(f"- **Data Quality Score:** {quality_score.get('overall_score', 0)}/100")
+        report.append(f"- **Null Values:** {overview.get('null_cells', 0):,} ({overview.get('null_percentage', 0)}%)")
+        report.append(f"- **Duplicate Rows:** {overview.get('duplicate_rows', 0):,}")
+        report.append(self._HRULE)
+        
+        # Column Overview
+        report.append("## 📋 Column Overview\n")
+        report.extend(self._dict_table(
+            validation_data.get('column_types', {}),
+            ['inferred_type', 'unique_values', 'null_count', 'null_percentage'],
+            ['Column', 'Type', 'Unique Values', 'Nulls', 'Null %'],
+            percent_columns=('null_percentage',)
+        ))
+
+        report.append(self._HRULE)
+
+        # Summary Statistics
+        if 'summary_stats' in analysis_data:
+            report.append("## 📈 Summary Statistics\n")
+            report.extend(self._dict_table(
+                analysis_data['summary_stats'],
+                ['count', 'mean', 'median', 'std_dev', 'min', 'max', 'q25', 'q75'],
+                ['Column', 'Count', 'Mean', 'Median', 'Std Dev', 'Min', 'Max',
+                 '25% Quartile', '75% Quartile']
+            ))
+
+            report.append(self._HRULE)
+
+        # Null Distribution
+        report.append("## 🔍 Null Value Distribution\n")
+        null_dist = {col: info for col, info in analysis_data.get('null_distribution', {}).items()
+                     if col != 'total'}
+        report.extend(self._dict_table(
+            null_dist,
+            ['null_count', 'null_percentage', 'non_null_count'],
+            ['Column', 'Null Count', 'Null %', 'Non-Null Count'],
+            percent_columns=('null_percentage',)
+        ))
+
+        report.append(self._HRULE)
+        
+        # Correlation Analysis
+        if 'high_correlations' in analysis_data and analysis_data['high_correlations']:
+            report.append("## 🔗 High Correlations\n")
+            report.append(self._CORR_HEADER)
+            
+            for corr in analysis_data['high_correlations'][:10]:
+                report.append(f"| {corr.get('column_1', '')} | {corr.get('column_2', '')} | "
+                             f"{corr.get('correlation', 0)} |")
+            
+            report.append(self._HRULE)
+        
+        # Data Quality Issues
+        if 'anomalies' in validation_data and validation_data['anomalies']:
+            report.append("## ⚠️ Data Quality Issues\n")
+            
+            for idx, anomaly in enumerate(validation_data['anomalies'][:10], 1):
+                report.append(f"\n{idx}. **{anomaly.get('type', 'Unknown')}**")
+                report.append(f"   - Column: {anomaly.get('column', 'N/A')}")
+                report.append(f"   - {anomaly.get('message', '')}")
+            
+            report.append(self._HRULE)
+        
+        # Duplicates
+        duplicates = validation_data.get('duplicates', {})
+        report.append("## 🔄 Duplicate Analysis\n")
+        report.append(f"- **Duplicate Rows:** {duplicates.get('duplicate_count', 0)} "
+                     f"({duplicates.get('duplicate_percentage', 0)}%)")
+        report.append(f"- **Unique Duplicate Sets:** {duplicates.get('duplicate_rows', 0)}")
+        report.append(self._HRULE)
+        
+        # Data Quality Score Details
+        report.append("## 🎯 Quality Score Breakdown\n")
+        scores = quality_score.get('scores', {})
+        
+        report.append(self._SCORE_HEADER)
+        report.append(f"| Null Score | {scores.get('null_score', 0)}/100 |")
+        report.append(f"| Duplicate Score | {scores.get('duplicate_score', 0)}/100 |")
+        report.append(f"| Type Consistency | {scores.get('type_score', 0)}/100 |")
+        report.append(f"| Anomaly Score | {scores.get('anomaly_score', 0)}/100 |")
+        
+        report.append(self._HRULE)
+        
+        # Footer
+        report.append("\n*Report generated by CSV Doctor - Smart CSV Cleaner and Analyzer*")
+        
+        return "\n".join(report)
+    
+    @staticmethod
+    def _convert_table_block(match):
+        """
+        Convert a block of Markdown table lines to an HTML table
+
+        Cell contents are HTML-escaped, so column names or values
+        containing < or & can neither break the report markup nor inject
+        script into it.
+
+        Args:
+            match: Regex match covering consecutive |-delimited lines
+
+        Returns:
+            HTML table string
+        """
+        rows = []
+        for line in match.group(0).strip().split('\n'):
+            cells = [cell.strip() for cell in line.strip().strip('|').split('|')]
+
+            # Skip the |----|----| separator row
+            if cells and all(cell and set(cell) <= set('-: ') for cell in cells):
+                continue
+
+            tag = 'th' if not rows else 'td'
+            rows.append('<tr>' + ''.join(
+                f'<{tag}>{escape(cell)}</{tag}>' for cell in cells
+            ) + '</tr>')
+
+        return '<table>\n' + '\n'.join(rows) + '\n</table>\n'
+
+    def generate_html_report(self, markdown_report):
+        """
+        Generate HTML report from Markdown
+        
+        Args:
+            markdown_report: Markdown report string
+        
+        Returns:
+            HTML formatted report string
+        """
+        # Single-pass conversion with precompiled patterns: each construct
+        # is handled by one C-level regex scan instead of repeated
+        # whole-string replaces
+        html = _MD_TABLE.sub(self._convert_table_block, markdown_report)
+        html = _MD_H3.sub(r'<h3>\1</h3>', html)
+        html = _MD_H2.sub(r'<h2>\1</h2>', html)
+        html = _MD_H1.sub(r'<h1>\1</h1>', html)
+        html = _MD_BOLD.sub(r'<strong>\1</strong>', html)
+        html = _MD_HR.sub('<hr>', html)
+
+        return _HTML_SHELL.replace('<!-- BODY -->', html)
+    
+    def generate_summary_statistics_table(self, stats):
+        """
+        Generate formatted statistics table
+        
+        Args:
+            stats: Dictionary of statistics
+        
+        Returns:
+            Markdown formatted table
+        """
+        table = "| Statistic | Value |\n|-----------|-------|\n"
+        
+        for key, value in stats.items():
+            table += f"| {key} | {value} |\n"
+        
+        return table
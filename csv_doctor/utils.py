@@ -0,0 +1,221 @@
+"""
+utils.py - Shared helper functions for CSV Doctor
+"""
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+# get_timestamp result cache: [epoch second, formatted string]
+_TS_CACHE = [0, '']
+
+
+def get_timestamp():
+    """Generate a timestamp string for file naming"""
+    # The string only changes once per second, so strftime runs at most
+    # once per second no matter how many files are being named
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = datetime.fromtimestamp(now).strftime("%Y%m%d_%H%M%S")
+    return _TS_CACHE[1]
+
+
+def create_upload_dir():
+    """Create uploads directory if it doesn't exist"""
+    upload_dir = Path("uploads")
+    upload_dir.mkdir(exist_ok=True)
+    return upload_dir
+
+
+def get_file_path(filename, directory="uploads"):
+    """Get safe file path"""
+    base_path = Path(directory)
+    base_path.mkdir(exist_ok=True)
+    file_path = base_path / filename
+    return file_path
+
+
+def safe_filename(filename):
+    """Generate a safe filename"""
+    timestamp = get_timestamp()
+    name, ext = os.path.splitext(filename)
+    return f"{name}_{timestamp}{ext}"
+
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def format_bytes(bytes_size):
+    """Format bytes to human-readable format"""
+    # bit_length picks the unit directly: each unit step is 10 bits,
+    # so no repeated division loop is needed
+    i = min((max(int(bytes_size), 1).bit_length() - 1) // 10,
+            len(_BYTE_UNITS) - 1)
+    return f"{bytes_size / (1 << (10 * i)):.2f} {_BYTE_UNITS[i]}"
+
+
+# Cap for type inference: columns longer than this are judged from a
+# prefix sample, which is plenty to clear the 0.8 coercion threshold
+INFER_SAMPLE_SIZE = 100_000
+
+
+def infer_column_type(series, sample_size=INFER_SAMPLE_SIZE):
+    """
+    Infer the data type of a pandas Series
+
+    Columns with more than sample_size non-null values are inferred from
+    the first sample_size of them, so inference cost stays bounded on
+    million-row files.
+
+    Returns: 'numeric', 'categorical', 'datetime', or 'text'
+    """
+    import pandas as pd
+
+    # Short-circuit on the dtype before any coercion: already-typed
+    # columns need no parsing pass at all (all-null stays 'unknown')
+    if pd.api.types.is_bool_dtype(series):
+        return 'categorical' if series.notna().any() else 'unknown'
+    if pd.api.types.is_numeric_dtype(series):
+        return 'numeric' if series.notna().any() else 'unknown'
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'datetime' if series.notna().any() else 'unknown'
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if series.isna().all():
+            return 'unknown'
+        if pd.api.types.is_numeric_dtype(series.cat.categories):
+            return 'numeric'
+        return 'categorical'
+
+    # Remove null values for type inference
+    non_null = series.dropna()
+
+    if len(non_null) == 0:
+        return 'unknown'
+
+    if sample_size is not None and len(non_null) > sample_size:
+        non_null = non_null.iloc[:sample_size]
+
+    # Check for numeric: coerce once and reuse the result instead of
+    # parsing the column twice
+    try:
+        if pd.to_numeric(non_null, errors='coerce').notna().mean() > 0.8:
+            return 'numeric'
+    except (ValueError, TypeError):
+        pass
+
+    # Check for datetime
+    try:
+        coerced = pd.to_datetime(non_null, errors='coerce', format='mixed')
+        if coerced.notna().mean() > 0.8:
+            return 'datetime'
+    except (ValueError, TypeError):
+        pass
+
+    # Check if categorical (low cardinality)
+    unique_count = non_null.nunique()
+    if unique_count / len(non_null) < 0.05 or unique_count < 20:
+        return 'categorical'
+
+    return 'text'
+
+
+def round_floats(obj, decimals=2):
+    """Round all floats in a dictionary or list to specified decimal places
+
+    Walks the structure with an explicit stack rather than recursion, so
+    deeply nested reports can't hit the recursion limit and each node
+    costs no Python call frame.
+    """
+    import numpy as np
+
+    holder = [obj]
+    stack = [(holder, 0)]
+    while stack:
+        parent, key = stack.pop()
+        node = parent[key]
+        if isinstance(node, dict):
+            new = {}
+            parent[key] = new
+            for k, v in node.items():
+                if isinstance(v, float):
+                    new[k] = round(v, decimals)
+                else:
+                    new[k] = v
+                    if isinstance(v, (dict, list)):
+                        stack.append((new, k))
+        elif isinstance(node, list):
+            # Homogeneous float lists (column stats arrays) round in one
+            # vectorized call instead of one Python round() per element
+            if node and all(type(x) is float for x in node):
+                parent[key] = np.round(np.asarray(node), decimals).tolist()
+            else:
+                new = list(node)
+                parent[key] = new
+                for i, v in enumerate(new):
+                    if isinstance(v, float):
+                        new[i] = round(v, decimals)
+                    elif isinstance(v, (dict, list)):
+                        stack.append((new, i))
+        elif isinstance(node, float):
+            parent[key] = round(node, decimals)
+    return holder[0]
+
+
+def sanitize_dict(obj):
+    """
+    Sanitize dictionary for JSON serialization
+    Converts NaN, Inf, and other non-serializable types
+
+    Iterative like round_floats: containers go on an explicit stack and
+    scalars convert in place, so nesting depth is never a limit.
+    """
+    import pandas as pd
+    import numpy as np
+
+    def _scalar(value):
+        if pd.isna(value) or (isinstance(value, float) and np.isnan(value)):
+            return None
+        if isinstance(value, (np.integer, np.floating)):
+            return value.item()
+        if isinstance(value, (int, float, str, bool, type(None))):
+            return value
+        return str(value)
+
+    containers = (dict, list, np.ndarray)
+    holder = [obj]
+    stack = [(holder, 0)]
+    while stack:
+        parent, key = stack.pop()
+        node = parent[key]
+        if isinstance(node, np.ndarray):
+            # Arrays convert wholesale: tolist() yields Python scalars,
+            # and only float arrays carry NaNs that need mapping to None
+            values = node.tolist()
+            parent[key] = values
+            if node.dtype.kind == 'f' and node.ndim == 1:
+                for i in np.flatnonzero(np.isnan(node)):
+                    values[i] = None
+            elif node.dtype.kind not in 'iub':
+                stack.append((parent, key))
+        elif isinstance(node, dict):
+            new = {}
+            parent[key] = new
+            for k, v in node.items():
+                if isinstance(v, containers):
+                    new[k] = v
+                    stack.append((new, k))
+                else:
+                    new[k] = _scalar(v)
+        elif isinstance(node, list):
+            new = list(node)
+            parent[key] = new
+            for i, v in enumerate(new):
+                if isinstance(v, containers):
+                    stack.append((new, i))
+                else:
+                    new[i] = _scalar(v)
+        else:
+            parent[key] = _scalar(node)
+    return holder[0]
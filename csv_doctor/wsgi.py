@@ -0,0 +1,24 @@
+"""
+wsgi.py - Production WSGI entry point for CSV Doctor
+
+The Werkzeug dev server started by `python main.py` handles one request
+at a time and keeps every session DataFrame in a single process forever.
+For real deployments run this module under gunicorn, e.g.:
+
+    gunicorn -w 1 -k gthread --threads $(nproc) \
+        --timeout 120 wsgi:app
+
+Sessions live in an in-process cache, so the deployment must stay at a
+single worker: with several workers a request can land on a worker that
+never saw the upload and fail with "Session not found", and worker
+recycling (--max-requests) drops every live session in the recycled
+process. One gthread worker with several threads still delivers the
+concurrency - the upload, analyze and export hot paths spend most of
+their time in GIL-releasing C code. Scale out beyond one process only
+behind session affinity or after moving sessions to a shared store.
+"""
+
+from main import app
+
+# Some WSGI servers look for the conventional name
+application = app